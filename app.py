@@ -1,11 +1,17 @@
 import os
+import time
 import uuid
 import tempfile
-from flask import Flask, request, render_template, redirect, url_for, send_file, flash
+import cProfile
+import threading
+from flask import Flask, request, render_template, redirect, url_for, send_file, flash, make_response, g
 from werkzeug.utils import secure_filename
 from resume_reader import extract_text
-from resume_parser import extract_resume_details
-from job_matcher import rank_candidates
+from resume_parser import extract_resume_details, PARSER_VERSION
+from job_matcher import rank_candidates, DEFAULT_WEIGHTS
+from candidate_store import CandidateStore, file_digest
+from result_cache import ResultCache, make_key
+from profiling import profiling_requested, save_profile
 
 # PDF generation
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
@@ -20,10 +26,59 @@ app = Flask(__name__)
 app.secret_key = 'replace-this-with-a-secure-random-key'
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB
+# HIREWISE_DISABLE_CACHES=1 turns off both the candidate store and the result
+# cache, so every request parses, ranks and builds its PDF (for benchmarking)
+app.config['CACHES_ENABLED'] = os.environ.get('HIREWISE_DISABLE_CACHES', '') != '1'
+app.config['CANDIDATE_STORE'] = os.environ.get(
+    'HIREWISE_CANDIDATE_STORE', os.path.join(UPLOAD_FOLDER, 'hirewise_candidates.store'))
+app.config['CANDIDATE_STORE_MAX_MB'] = int(os.environ.get('HIREWISE_CANDIDATE_STORE_MAX_MB', 256))
+
+# Parsed candidates keyed by file content, shared by all workers via mmap.
+# Opened on first use so an unwritable upload folder only disables the store.
+candidate_store = None
+candidate_store_lock = threading.Lock()
+
+def get_candidate_store():
+    global candidate_store
+    if candidate_store is None and app.config['CACHES_ENABLED']:
+        with candidate_store_lock:
+            if candidate_store is None:
+                try:
+                    candidate_store = CandidateStore(app.config['CANDIDATE_STORE'], PARSER_VERSION,
+                                                     app.config['CANDIDATE_STORE_MAX_MB'] * 1024 * 1024)
+                except OSError as e:
+                    print(f"Candidate store unavailable ({app.config['CANDIDATE_STORE']}): {e}")
+    return candidate_store
+
+app.config['RESULT_CACHE_SIZE'] = int(os.environ.get('HIREWISE_RESULT_CACHE_SIZE', 128))
+app.config['RESULT_CACHE_TTL'] = float(os.environ.get('HIREWISE_RESULT_CACHE_TTL', 3600))
+
+# Finished results pages + PDF reports for repeated identical submissions
+result_cache = ResultCache(app.config['RESULT_CACHE_SIZE'], app.config['RESULT_CACHE_TTL'])
+
+# Opt-in pipeline profiling (see profiling.py); off unless configured
+app.config['PROFILE_PIPELINE'] = os.environ.get('HIREWISE_PROFILE', '') == '1'
+app.config['PROFILE_TOKEN'] = os.environ.get('HIREWISE_PROFILE_TOKEN', '')
+app.config['PROFILE_DIR'] = os.environ.get(
+    'HIREWISE_PROFILE_DIR', os.path.join(UPLOAD_FOLDER, 'hirewise_profiles'))
+app.config['PROFILE_TOP_FILES'] = int(os.environ.get('HIREWISE_PROFILE_TOP_FILES', 5))
+app.config['PROFILE_KEEP_RUNS'] = int(os.environ.get('HIREWISE_PROFILE_KEEP_RUNS', 20))
+
+# Only one cProfile may be active per process (Python 3.12+); overlapping
+# profiled requests fall back to per-file timings only
+profile_lock = threading.Lock()
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def server_timing(timings):
+    # Per-stage durations as a Server-Timing header value (milliseconds)
+    return ", ".join(f"{name};dur={secs * 1000:.1f}" for name, secs in timings.items())
+
+def cache_status(result_hit, store_hits, files):
+    # X-HireWise-Cache header value, read by loadtest.py to count cache hits
+    return f"result={'hit' if result_hit else 'miss'}; store_hits={store_hits}; files={files}"
+
 def get_presets():
     return {
         'Data Scientist (example)': 'python, machine learning, deep learning, sql, pandas',
@@ -35,6 +90,32 @@ def landing():
     return render_template('landing.html')
 @app.route('/match', methods=['GET', 'POST'])
 def index():
+    if request.method != 'POST':
+        return run_match()
+    # Token only from the form body or a header, never the logged query string
+    flag = request.form.get('profile') or request.headers.get('X-HireWise-Profile')
+    if not profiling_requested(app.config, {'profile': flag}):
+        return run_match()
+
+    g.file_timings = []
+    profile = cProfile.Profile() if profile_lock.acquire(blocking=False) else None
+    start = time.perf_counter()
+    try:
+        return profile.runcall(run_match) if profile else run_match()
+    finally:
+        total = time.perf_counter() - start
+        if profile:
+            profile_lock.release()
+        try:
+            run_id = save_profile(profile, g.file_timings, app.config['PROFILE_DIR'],
+                                  app.config['PROFILE_TOP_FILES'], total,
+                                  app.config['PROFILE_KEEP_RUNS'])
+            if run_id:
+                print(f"Saved pipeline profile {run_id} to {app.config['PROFILE_DIR']}")
+        except Exception as e:
+            print(f"Failed to save pipeline profile: {e}")
+
+def run_match():
     # Pre-filled values (used if form reloads after validation error)
     form_data = {
         'job_skills': '',
@@ -66,6 +147,8 @@ def index():
 
         saved_files = []
         resumes_parsed = []
+        timings = {}
+        stage_start = time.perf_counter()
 
         # Save files with unique names (keep original name for display)
         for f in uploaded:
@@ -78,7 +161,7 @@ def index():
                 path = os.path.join(app.config['UPLOAD_FOLDER'], unique_name)
                 try:
                     f.save(path)
-                    saved_files.append((filename, path))
+                    saved_files.append((filename, path, file_digest(path)))
                 except Exception as e:
                     flash(f"Failed to save uploaded file {filename}: {e}")
             else:
@@ -89,9 +172,60 @@ def index():
             flash("⚠ No valid resume files were uploaded (supported: .pdf, .txt, .docx).")
             return render_template('index.html', presets=get_presets(), form_data=form_data)
 
-        # Parse resumes
-        for original_name, path in saved_files:
-            text = extract_text(path)
+        now = time.perf_counter()
+        timings['save'] = now - stage_start
+        stage_start = now
+
+        job_req = {
+            'skills': form_data['job_skills'],
+            'experience': req_experience,
+            'education': form_data['education']
+        }
+
+        # Profiled requests skip both caches so the full pipeline is measured
+        file_timings = g.get('file_timings')
+        profiling = file_timings is not None
+        use_caches = app.config['CACHES_ENABLED'] and not profiling
+
+        # Same files + same requirements: serve the stored page and PDF
+        cache_key = make_key(job_req, DEFAULT_WEIGHTS, [(name, digest) for name, _, digest in saved_files])
+        cached = result_cache.get(cache_key) if use_caches else None
+        if cached is not None:
+            if os.path.exists(os.path.join(app.config['UPLOAD_FOLDER'], cached['pdf_name'])):
+                timings['cache'] = time.perf_counter() - stage_start
+                response = make_response(cached['html'])
+                response.headers['Server-Timing'] = server_timing(timings)
+                response.headers['X-HireWise-Cache'] = cache_status(True, 0, len(saved_files))
+                return response
+            result_cache.discard(cache_key)
+
+        # Parse resumes (reuse earlier parses of identical files from the shared store)
+        store_hits = 0
+        store = get_candidate_store()  # None when caches are off or the store is unavailable
+        for original_name, path, digest in saved_files:
+            stored = None
+            if use_caches and store is not None:
+                try:
+                    stored = store.get(digest)
+                except Exception as e:
+                    print(f"Could not read candidate store for {original_name}: {e}")
+            if stored is not None:
+                store_hits += 1
+                stored['file_name'] = original_name
+                resumes_parsed.append(stored)
+                continue
+            if not profiling:
+                text = extract_text(path)
+                extractor_timings = None
+            else:
+                extract_start = time.perf_counter()
+                text = extract_text(path)
+                extractor_timings = {}
+                file_timings.append({
+                    'file_name': original_name,
+                    'extract_text': time.perf_counter() - extract_start,
+                    'extractors': extractor_timings
+                })
             if not text:
                 resumes_parsed.append({
                     'file_name': original_name,
@@ -101,21 +235,28 @@ def index():
                     'raw_text': ''
                 })
             else:
-                parsed = extract_resume_details(text)
-                parsed['file_name'] = original_name
+                parsed = extract_resume_details(text, timings=extractor_timings)
                 # simple heuristic for name
                 first_lines = [l.strip() for l in text.splitlines() if l.strip()]
                 if first_lines:
                     parsed['name'] = first_lines[0][:80]
+                if store is not None:
+                    try:
+                        store.append(digest, parsed)
+                    except Exception as e:
+                        print(f"Could not store parsed candidate {original_name}: {e}")
+                parsed['file_name'] = original_name
                 resumes_parsed.append(parsed)
 
-        job_req = {
-            'skills': form_data['job_skills'],
-            'experience': req_experience,
-            'education': form_data['education']
-        }
+        now = time.perf_counter()
+        timings['parse'] = now - stage_start
+        stage_start = now
 
-        ranked = rank_candidates(resumes_parsed, job_req)
+        ranked = rank_candidates(resumes_parsed, job_req, DEFAULT_WEIGHTS)
+
+        now = time.perf_counter()
+        timings['rank'] = now - stage_start
+        stage_start = now
 
         # PDF report path
         pdf_filename = f"ranked_results_{uuid.uuid4().hex[:8]}.pdf"
@@ -178,13 +319,21 @@ def index():
             flash(f"Failed to generate PDF report: {e}")
             return render_template('index.html', presets=get_presets(), form_data=form_data)
 
+        timings['pdf'] = time.perf_counter() - stage_start
+
         # Render results page with PDF link
-        return render_template(
+        html = render_template(
             'results.html',
             ranked=ranked,
             csv_download=True,
             csv_name=os.path.basename(pdf_path)
         )
+        if use_caches:
+            result_cache.put(cache_key, {'html': html, 'pdf_name': os.path.basename(pdf_path)})
+        response = make_response(html)
+        response.headers['Server-Timing'] = server_timing(timings)
+        response.headers['X-HireWise-Cache'] = cache_status(False, store_hits, len(saved_files))
+        return response
 
     # GET request: show blank form (or with presets)
     return render_template('index.html',  form_data=form_data)
@@ -0,0 +1,149 @@
+# bench_docx.py
+# Compare the streaming DOCX reader against the python-docx based one.
+#   python bench_docx.py                 -> uses a generated synthetic resume
+#   python bench_docx.py a.docx b.docx   -> uses the given files
+# Peak memory is the RSS of a fresh subprocess per reader, so native (lxml)
+# allocations made by python-docx are counted too.
+import os
+import sys
+import time
+import zipfile
+import tempfile
+import subprocess
+try:
+    import resource
+except Exception:
+    resource = None  # not available on Windows; memory is reported as n/a
+import resume_reader
+from resume_reader import extract_text_from_docx, extract_text_from_docx_python_docx
+
+READERS = {
+    'streaming': extract_text_from_docx,
+    'python-docx': extract_text_from_docx_python_docx,
+}
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+def _para(text: str) -> str:
+    return f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+
+def make_synthetic_docx(path: str, sections: int = 2000) -> str:
+    # Large resume-like document: paragraphs plus an education/skills table per section
+    parts = [_para("Jane Candidate"), _para("jane@example.com")]
+    for i in range(sections):
+        parts.append(_para(f"Experience {i}"))
+        parts.append(_para(f"Software Engineer at Company {i}  June 2019 - Present"))
+        parts.append(_para("Built services in python, flask and sql on aws. " * 3))
+        parts.append(
+            "<w:tbl>"
+            "<w:tr><w:tc>" + _para("B.Tech Computer Science") + "</w:tc>"
+            "<w:tc>" + _para("2015 - 2019") + "</w:tc></w:tr>"
+            "<w:tr><w:tc>" + _para("Skills") + "</w:tc>"
+            "<w:tc>" + _para("python, machine learning, react") + "</w:tc></w:tr>"
+            "</w:tbl>"
+        )
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W_NS}"><w:body>{"".join(parts)}<w:sectPr/></w:body></w:document>'
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '</Types>'
+    )
+    rels = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/></Relationships>'
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", content_types)
+        zf.writestr("_rels/.rels", rels)
+        zf.writestr("word/document.xml", xml)
+    return path
+
+def _maxrss_kib() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss  # bytes on macOS, KiB on Linux
+
+def _rss_child(reader: str, path: str):
+    # Runs in the subprocess: report peak RSS before and after one read
+    before = _maxrss_kib()
+    READERS[reader](path)
+    print(before, _maxrss_kib())
+
+def measure_rss(reader: str, path: str):
+    # (peak RSS KiB, growth over the import-only baseline KiB) in a fresh process
+    if resource is None:
+        return None
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--rss-child", reader, path],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    ).stdout.split()
+    before, after = int(out[-2]), int(out[-1])
+    return after, after - before
+
+def measure(reader: str, path: str, repeat: int = 3):
+    func = READERS[reader]
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best, measure_rss(reader, path)
+
+def fmt_rss(rss) -> str:
+    return "peak RSS n/a" if rss is None else f"peak RSS {rss[0]:8d} KiB (+{rss[1]} KiB)"
+
+def paragraphs_in_order(expected: str, actual: str) -> bool:
+    # Every python-docx paragraph must appear, in order, in the streaming output
+    pos = 0
+    for line in expected.splitlines():
+        if not line.strip():
+            continue
+        found = actual.find(line, pos)
+        if found < 0:
+            return False
+        pos = found + len(line)
+    return True
+
+def main():
+    if sys.argv[1:2] == ["--rss-child"]:
+        _rss_child(sys.argv[2], sys.argv[3])
+        return
+    paths = sys.argv[1:]
+    tmp_dir = None
+    if not paths:
+        tmp_dir = tempfile.mkdtemp()
+        paths = [make_synthetic_docx(os.path.join(tmp_dir, "synthetic_resume.docx"))]
+
+    for path in paths:
+        new_text, new_time, new_rss = measure('streaming', path)
+        print(f"{os.path.basename(path)}")
+        print(f"  streaming  : {new_time * 1000:8.1f} ms  {fmt_rss(new_rss)}  {len(new_text or '')} chars")
+        if resume_reader.docx is None:
+            print("  python-docx: unavailable")
+            continue
+        old_text, old_time, old_rss = measure('python-docx', path)
+        print(f"  python-docx: {old_time * 1000:8.1f} ms  {fmt_rss(old_rss)}  {len(old_text or '')} chars")
+        memory = ""
+        if new_rss and old_rss:
+            memory = f"memory growth x{max(old_rss[1], 1) / max(new_rss[1], 1):.1f}, "
+        print(f"  speedup x{old_time / max(new_time, 1e-9):.1f}, {memory}"
+              f"paragraph parity: {'OK' if paragraphs_in_order(old_text or '', new_text or '') else 'MISMATCH'}")
+
+    if tmp_dir:
+        for name in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, name))
+        os.rmdir(tmp_dir)
+
+if __name__ == '__main__':
+    main()
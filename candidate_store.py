@@ -0,0 +1,191 @@
+# candidate_store.py
+# Append-only on-disk store of parsed candidates, shared by all gunicorn workers,
+# so a resume parsed by one worker is not parsed again by another.
+# Every worker maps the same file read-only (the OS shares the pages) and keeps
+# only a digest -> offset index in memory. A lookup is not zero-copy: it copies
+# the record out of the map and json.loads it, full raw_text included.
+# Writers append while holding an flock on <path>.lock; readers pick up new
+# records by remapping when the file grows.
+#
+# The file is never truncated in place (a live map past EOF would SIGBUS): when it
+# has to be reset - missing, written by an older parser version, or over its size
+# limit - a fresh file is built and swapped in with os.replace, and readers notice
+# the new inode and drop their index. A store owned by a newer parser version is
+# left alone and treated as empty.
+import os
+import json
+import mmap
+import struct
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+try:
+    import fcntl
+except Exception:
+    fcntl = None  # no flock on Windows; single-process dev server only
+
+MAGIC = b"HWCS0002"
+# file header: magic, parser version of every record in the file
+FILE_HEADER = struct.Struct("<8sI")
+# record header: sha1 digest of the resume file, payload length
+RECORD_HEADER = struct.Struct("<20sI")
+
+def file_digest(path: str) -> bytes:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.digest()
+
+class CandidateStore:
+    def __init__(self, path: str, version: int = 0, max_bytes: int = 256 * 1024 * 1024):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self.version = version
+        self.max_bytes = max_bytes
+        self._header = FILE_HEADER.pack(MAGIC, version)
+        self._lock = threading.Lock()
+        self._mm: Optional[mmap.mmap] = None
+        self._ino = None
+        self._size = 0
+        self._compatible = False
+        self._file_version = None
+        self._scanned = FILE_HEADER.size
+        # digest -> (payload offset, payload length); offsets only, payloads stay in the map
+        self._index: Dict[bytes, Tuple[int, int]] = {}
+        self._ensure_file()
+
+    # ---------- file management ----------
+    def _read_header(self) -> Optional[bytes]:
+        try:
+            with open(self.path, "rb") as f:
+                return f.read(FILE_HEADER.size)
+        except FileNotFoundError:
+            return None
+
+    def _replace_file(self, data: bytes = b""):
+        # Build the new store next to the old one and swap it in atomically
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._header + data)
+        os.replace(tmp, self.path)
+
+    def _newer_version(self, header: Optional[bytes]) -> bool:
+        if not header or len(header) < FILE_HEADER.size:
+            return False
+        magic, file_version = FILE_HEADER.unpack_from(header, 0)
+        return magic == MAGIC and file_version > self.version
+
+    @contextmanager
+    def _file_lock(self):
+        # Separate lock file: its inode survives os.replace of the store itself
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # releases the flock
+
+    def _ensure_file(self):
+        # Missing file or one from an older parser version: start a fresh store
+        with self._file_lock():
+            header = self._read_header()
+            if header != self._header and not self._newer_version(header):
+                self._replace_file()
+
+    # ---------- reading (callers hold self._lock) ----------
+    def _reset(self, ino):
+        # Old maps are not closed: a thread may still hold one; it is freed with its last reference
+        self._mm = None
+        self._ino = ino
+        self._size = 0
+        self._compatible = False
+        self._file_version = None
+        self._scanned = FILE_HEADER.size
+        self._index = {}
+
+    def _refresh(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            # e.g. removed by a tmp cleaner: empty until the next append recreates it
+            if self._ino is not None:
+                self._reset(None)
+            return
+        if st.st_ino != self._ino or st.st_size < self._size:
+            self._reset(st.st_ino)
+        elif st.st_size == self._size:
+            return
+        if st.st_size < FILE_HEADER.size:
+            return
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_ino != st.st_ino:
+                return  # swapped between stat and open; picked up on the next call
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._size = len(self._mm)
+        # A store written by another parser version is treated as empty
+        magic, file_version = FILE_HEADER.unpack_from(self._mm, 0)
+        self._file_version = file_version if magic == MAGIC else None
+        self._compatible = self._mm[:FILE_HEADER.size] == self._header
+        if self._compatible:
+            self._scan()
+
+    def _scan(self):
+        # Index records appended since the last scan; stop at a partially written tail
+        pos = self._scanned
+        while pos + RECORD_HEADER.size <= self._size:
+            digest, length = RECORD_HEADER.unpack_from(self._mm, pos)
+            start = pos + RECORD_HEADER.size
+            if start + length > self._size:
+                break
+            self._index.setdefault(digest, (start, length))
+            pos = start + length
+        self._scanned = pos
+
+    def _payload(self, digest: bytes) -> Optional[bytes]:
+        loc = self._index.get(digest)
+        if loc is None:
+            self._refresh()
+            loc = self._index.get(digest)
+            if loc is None:
+                return None
+        offset, length = loc
+        return self._mm[offset:offset + length]
+
+    def get(self, digest: bytes) -> Optional[Dict]:
+        with self._lock:
+            payload = self._payload(digest)
+        return None if payload is None else json.loads(payload)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._index)
+
+    # ---------- writing ----------
+    def append(self, digest: bytes, record: Dict):
+        payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        data = RECORD_HEADER.pack(digest, len(payload)) + payload
+        with self._file_lock():
+            with self._lock:
+                self._refresh()
+                if digest in self._index:
+                    return  # another worker parsed the same file first
+                if not self._compatible and (self._file_version or 0) > self.version:
+                    return  # store belongs to a newer parser version; leave it alone
+                compatible = self._compatible
+                size = self._size
+            if not compatible or size + len(data) > self.max_bytes:
+                self._replace_file(data)
+            else:
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+                try:
+                    os.write(fd, data)
+                finally:
+                    os.close(fd)
+
+    def close(self):
+        with self._lock:
+            self._reset(None)
@@ -7,6 +7,7 @@ from resume_parser import (
 )
 
 CURRENT_YEAR = datetime.today().year
+DEFAULT_WEIGHTS = {'skills': 0.6, 'experience': 0.3, 'education': 0.1}
 
 # Helper functions
 def _variant_pattern(variant: str) -> str:
@@ -126,7 +127,7 @@ def education_matches(candidate_resume: Dict, requirement_str: str) -> bool:
     return False
 
 def score_candidate(resume: Dict, job_requirements: Dict, weights: Dict = None) -> Dict:
-    weights = weights or {'skills': 0.6, 'experience': 0.3, 'education': 0.1}
+    weights = weights or DEFAULT_WEIGHTS
 
     # Skills
     if isinstance(job_requirements.get('skills'), str):
@@ -0,0 +1,323 @@
+# loadtest.py
+# Load generator for the /match upload -> parse -> rank -> PDF flow.
+#   python loadtest.py                                  -> in-process Werkzeug server
+#   python loadtest.py --server gunicorn --workers 4    -> local gunicorn (Procfile setup)
+#   python loadtest.py --url http://127.0.0.1:8000      -> an already running instance
+# Per-stage timings come from the Server-Timing header set by app.index, cache
+# hits from its X-HireWise-Cache header. Every uploaded file gets a per-request
+# nonce so the candidate store and result cache do not turn the run into cache
+# hits; servers started here also get a fresh store (--no-caches disables both).
+import os
+import sys
+import json
+import math
+import time
+import uuid
+import random
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from bench_docx import make_synthetic_docx
+
+SKILLS = ['python', 'java', 'sql', 'machine learning', 'deep learning', 'flask',
+          'django', 'react', 'javascript', 'aws', 'html', 'css', 'git', 'pytorch']
+DEGREES = ['B.Tech Computer Science', 'B.Sc Information Technology', 'MBA', 'M.Tech CSE', 'BBA']
+MONTHS = ['January', 'March', 'June', 'August', 'October']
+
+# ---------- synthetic corpus ----------
+def make_resume_text(rng: random.Random, idx: int) -> str:
+    start = rng.randint(2012, 2022)
+    lines = [
+        f"Candidate {idx}",
+        f"candidate{idx}@example.com",
+        "Skills",
+        ", ".join(rng.sample(SKILLS, rng.randint(3, 8))),
+        "Experience",
+    ]
+    for _ in range(rng.randint(1, 4)):
+        y = rng.randint(start, 2024)
+        lines.append(f"Engineer at Company {rng.randint(1, 999)}  {rng.choice(MONTHS)} {y} - Present")
+        lines.append("Worked on backend services and data pipelines. " * rng.randint(1, 6))
+    lines.append("Education")
+    lines.append(f"{rng.choice(DEGREES)} {start - 4} - {start}")
+    return "\n".join(lines) + "\n"
+
+def build_corpus(directory: str, size: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    paths = []
+    for i in range(size):
+        if i % 3 == 2:
+            path = make_synthetic_docx(os.path.join(directory, f"resume_{i}.docx"), sections=rng.randint(1, 5))
+        else:
+            path = os.path.join(directory, f"resume_{i}.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(make_resume_text(rng, i))
+        paths.append(path)
+    return paths
+
+# ---------- HTTP ----------
+def with_nonce(path: str, data: bytes, nonce: str) -> bytes:
+    # Make the file content unique without changing what the parser sees much
+    if path.lower().endswith(".docx") and data[-22:-18] == b"PK\x05\x06":
+        # zip without a comment: put the nonce in the end-of-central-directory comment
+        comment = nonce.encode()
+        return data[:-2] + len(comment).to_bytes(2, "little") + comment
+    return data + f"\nRef {nonce}\n".encode()
+
+def encode_multipart(fields: Dict[str, str], files: List[Tuple[str, str]],
+                     nonce: Optional[str] = None) -> Tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    out = []
+    for name, value in fields.items():
+        out.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, path in files:
+        with open(path, "rb") as f:
+            data = f.read()
+        if nonce:
+            data = with_nonce(path, data, nonce)
+        out.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+            f'filename="{os.path.basename(path)}"\r\n'
+            'Content-Type: application/octet-stream\r\n\r\n'.encode()
+        )
+        out.append(data + b"\r\n")
+    out.append(f"--{boundary}--\r\n".encode())
+    return b"".join(out), f"multipart/form-data; boundary={boundary}"
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    stages = {}
+    for part in (header or "").split(","):
+        bits = [b.strip() for b in part.split(";")]
+        if not bits[0]:
+            continue
+        for b in bits[1:]:
+            if b.startswith("dur="):
+                try:
+                    stages[bits[0]] = float(b[4:])
+                except ValueError:
+                    pass
+    return stages
+
+def parse_cache_status(header: str) -> Dict[str, int]:
+    # "result=miss; store_hits=3; files=5" -> counters
+    fields = dict(part.strip().partition("=")[::2] for part in (header or "").split(";") if "=" in part)
+    return {
+        "result_hit": int(fields.get("result") == "hit"),
+        "store_hits": int(fields.get("store_hits") or 0),
+    }
+
+def send_upload(base_url: str, files: List[str], form: Dict[str, str], timeout: float,
+                unique: bool = True) -> Dict:
+    nonce = uuid.uuid4().hex if unique else None
+    body, content_type = encode_multipart(form, [("resumes", p) for p in files], nonce)
+    req = urllib.request.Request(base_url + "/match", data=body, method="POST",
+                                 headers={"Content-Type": content_type})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            resp.read()
+            status = resp.status
+            timing = resp.headers.get("Server-Timing", "")
+            cache = resp.headers.get("X-HireWise-Cache", "")
+    except urllib.error.HTTPError as e:
+        status, timing, cache = e.code, "", ""
+    except Exception as e:
+        return {"ok": False, "error": str(e), "latency": time.perf_counter() - start, "stages": {},
+                "cache": parse_cache_status("")}
+    latency = time.perf_counter() - start
+    # A 200 without Server-Timing is the form re-rendered with a validation error
+    ok = status == 200 and bool(timing)
+    return {"ok": ok, "error": None if ok else f"HTTP {status}", "latency": latency,
+            "stages": parse_server_timing(timing), "cache": parse_cache_status(cache)}
+
+# ---------- servers ----------
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def wait_healthy(base_url: str, timeout: float = 30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(base_url + "/health", timeout=2) as resp:
+                if resp.status == 200:
+                    return
+        except Exception:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not become healthy")
+
+def server_env(store_path: str, caches: bool) -> Dict[str, str]:
+    # app.py reads these at import time
+    env = {"HIREWISE_CANDIDATE_STORE": store_path}
+    if not caches:
+        env["HIREWISE_DISABLE_CACHES"] = "1"
+    return env
+
+def start_inprocess(env: Dict[str, str]) -> Tuple[str, Callable[[], None]]:
+    os.environ.update(env)
+    from werkzeug.serving import make_server
+    from app import app
+    server = make_server("127.0.0.1", free_port(), app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return f"http://127.0.0.1:{server.server_port}", server.shutdown
+
+def start_gunicorn(workers: int, threads: int, env: Dict[str, str]) -> Tuple[str, Callable[[], None]]:
+    port = free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-w", str(workers), "--threads", str(threads),
+         "-b", f"127.0.0.1:{port}", "app:app"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env={**os.environ, **env},
+    )
+    def stop():
+        proc.terminate()
+        proc.wait(timeout=10)
+    return f"http://127.0.0.1:{port}", stop
+
+# ---------- stats ----------
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[k]
+
+def summarize(values_ms: List[float]) -> Dict:
+    return {
+        "p50": percentile(values_ms, 50),
+        "p95": percentile(values_ms, 95),
+        "p99": percentile(values_ms, 99),
+        "mean": (sum(values_ms) / len(values_ms)) if values_ms else None,
+    }
+
+def parse_mix(spec: str) -> List[Tuple[int, float]]:
+    # "1:0.5,5:0.3,20:0.2" -> files per upload with relative weights
+    mix = []
+    for part in spec.split(","):
+        n, _, w = part.partition(":")
+        mix.append((int(n), float(w or 1)))
+    return mix
+
+def run_level(base_url: str, corpus: List[str], mix: List[Tuple[int, float]], concurrency: int,
+              total: int, form: Dict[str, str], seed: int, timeout: float, unique: bool = True) -> Dict:
+    rng = random.Random(seed + concurrency)
+    sizes, weights = zip(*mix)
+    jobs = []
+    for _ in range(total):
+        n = min(rng.choices(sizes, weights)[0], len(corpus))
+        jobs.append(rng.sample(corpus, n))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda files: send_upload(base_url, files, form, timeout, unique), jobs))
+    elapsed = time.perf_counter() - start
+
+    ok = [r for r in results if r["ok"]]
+    stage_names = sorted({s for r in ok for s in r["stages"]})
+    errors = {}
+    for r in results:
+        if not r["ok"]:
+            errors[r["error"]] = errors.get(r["error"], 0) + 1
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "files": sum(len(j) for j in jobs),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(ok) / elapsed if elapsed else 0.0,
+        "error_rate": 1 - len(ok) / total if total else 0.0,
+        "errors": errors,
+        "cache": {
+            "result_hits": sum(r["cache"]["result_hit"] for r in ok),
+            "store_hits": sum(r["cache"]["store_hits"] for r in ok),
+        },
+        "latency_ms": summarize([r["latency"] * 1000 for r in ok]),
+        "stages_ms": {s: summarize([r["stages"][s] for r in ok if s in r["stages"]]) for s in stage_names},
+    }
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+def fmt(v: Optional[float]) -> str:
+    return "     -" if v is None else f"{v:7.1f}"
+
+def main():
+    ap = argparse.ArgumentParser(description="Load test the HireWise /match flow")
+    ap.add_argument("--server", choices=["inprocess", "gunicorn"], default="inprocess")
+    ap.add_argument("--url", help="test an already running server instead of starting one")
+    ap.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    ap.add_argument("--threads", type=int, default=1, help="gunicorn threads per worker")
+    ap.add_argument("--concurrency", default="1,2,4,8", help="comma separated concurrency levels")
+    ap.add_argument("--requests", type=int, default=40, help="requests per concurrency level")
+    ap.add_argument("--mix", default="1:0.4,5:0.4,20:0.2", help="files-per-upload:weight pairs")
+    ap.add_argument("--corpus-size", type=int, default=30)
+    ap.add_argument("--skills", default="python, machine learning, sql, flask")
+    ap.add_argument("--experience", default="1")
+    ap.add_argument("--education", default="btech")
+    ap.add_argument("--timeout", type=float, default=120.0)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--repeat-files", action="store_true",
+                    help="upload corpus files unchanged (measures cache hits instead of the pipeline)")
+    ap.add_argument("--no-caches", action="store_true",
+                    help="start the server with the candidate store and result cache disabled")
+    ap.add_argument("--out", default="loadtest_results.json", help="where to write JSON results")
+    args = ap.parse_args()
+
+    corpus_dir = tempfile.mkdtemp(prefix="hirewise_corpus_")
+    corpus = build_corpus(corpus_dir, args.corpus_size, args.seed)
+    form = {"job_skills": args.skills, "experience": args.experience, "education": args.education}
+
+    # Servers started here get their own empty candidate store
+    env = server_env(os.path.join(corpus_dir, "candidates.store"), not args.no_caches)
+    stop = None
+    if args.url:
+        base_url = args.url.rstrip("/")
+    elif args.server == "gunicorn":
+        base_url, stop = start_gunicorn(args.workers, args.threads, env)
+    else:
+        base_url, stop = start_inprocess(env)
+
+    levels = []
+    try:
+        wait_healthy(base_url)
+        for c in [int(x) for x in args.concurrency.split(",") if x.strip()]:
+            level = run_level(base_url, corpus, parse_mix(args.mix), c, args.requests, form,
+                              args.seed, args.timeout, not args.repeat_files)
+            levels.append(level)
+            lat = level["latency_ms"]
+            print(f"c={c:<3} rps={level['throughput_rps']:6.2f} err={level['error_rate'] * 100:5.1f}%  "
+                  f"p50={fmt(lat['p50'])} p95={fmt(lat['p95'])} p99={fmt(lat['p99'])} ms  "
+                  f"cache hits: result={level['cache']['result_hits']} store={level['cache']['store_hits']}")
+            for stage, st in level["stages_ms"].items():
+                print(f"      {stage:<6} p50={fmt(st['p50'])} p95={fmt(st['p95'])} p99={fmt(st['p99'])} ms")
+    finally:
+        if stop:
+            stop()
+        for name in os.listdir(corpus_dir):
+            os.remove(os.path.join(corpus_dir, name))
+        os.rmdir(corpus_dir)
+
+    result = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "target": args.url or args.server,
+        "config": {k: v for k, v in vars(args).items() if k != "out"},
+        "levels": levels,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"Results written to {args.out}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# profiling.py
+# Opt-in profiling of the /match pipeline. Enabled for every request with
+# HIREWISE_PROFILE=1, or per request by sending profile=<HIREWISE_PROFILE_TOKEN>
+# as a form field or an X-HireWise-Profile header (never the query string, which
+# ends up in access logs). Each profiled POST writes to the profile dir:
+#   <id>.prof  cProfile stats of app.index (open with pstats / snakeviz)
+#   <id>.txt   top functions by cumulative time
+#   <id>.json  per-file extract_text / extractor timings, slowest files first
+# .prof/.txt are missing when another request held the profiler. Only the
+# slowest HIREWISE_PROFILE_KEEP_RUNS runs are kept.
+import os
+import io
+import hmac
+import json
+import time
+import uuid
+import pstats
+import cProfile
+from typing import Dict, List, Optional
+
+def profiling_requested(config: Dict, values: Dict) -> bool:
+    if config.get('PROFILE_PIPELINE'):
+        return True
+    token = config.get('PROFILE_TOKEN')
+    flag = values.get('profile')
+    if not (token and flag):
+        return False
+    # compare bytes: compare_digest rejects non-ASCII str arguments
+    return hmac.compare_digest(str(flag).encode('utf-8'), str(token).encode('utf-8'))
+
+def _prune_runs(directory: str, keep: int):
+    # Keep the `keep` slowest runs (by request_secs); delete the rest
+    runs = []
+    for name in os.listdir(directory):
+        if not name.endswith(".json"):
+            continue
+        run_id = name[:-len(".json")]
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                secs = json.load(f).get('request_secs') or 0.0
+        except Exception:
+            secs = 0.0
+        runs.append((secs, run_id))
+    runs.sort(reverse=True)
+    removed = set()
+    for _, run_id in runs[max(keep, 0):]:
+        removed.add(run_id)
+        for ext in (".json", ".prof", ".txt"):
+            try:
+                os.remove(os.path.join(directory, run_id + ext))
+            except FileNotFoundError:
+                pass
+    return removed
+
+def save_profile(profile: Optional[cProfile.Profile], file_timings: List[Dict], directory: str,
+                 top_files: int = 5, total_secs: Optional[float] = None,
+                 keep_runs: int = 20) -> Optional[str]:
+    os.makedirs(directory, exist_ok=True)
+    run_id = f"{time.strftime('%Y%m%d-%H%M%S')}_{uuid.uuid4().hex[:6]}"
+    base = os.path.join(directory, run_id)
+
+    if profile is not None:
+        profile.dump_stats(base + ".prof")
+
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(40)
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(out.getvalue())
+
+    for t in file_timings:
+        t['total'] = t['extract_text'] + sum(t['extractors'].values())
+    slowest = sorted(file_timings, key=lambda t: t['total'], reverse=True)
+    with open(base + ".json", "w", encoding="utf-8") as f:
+        json.dump({
+            'id': run_id,
+            'request_secs': total_secs,
+            'cprofile': profile is not None,
+            'files': len(file_timings),
+            'slowest_files': slowest[:top_files],
+        }, f, indent=2)
+
+    if run_id in _prune_runs(directory, keep_runs):
+        return None
+    return run_id
@@ -0,0 +1,67 @@
+# result_cache.py
+# Memoizes complete /match results (rendered page + PDF report name) so that
+# resubmitting the same files with the same requirements skips parsing,
+# ranking and the ReportLab build. Bounded LRU with per-entry TTL, kept per
+# process: under N gunicorn workers a resubmission hits it about 1 time in N.
+import re
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+def _normalize_text(value: str) -> str:
+    return re.sub(r'\s+', ' ', (value or '').strip().lower())
+
+def make_key(job_req: Dict, weights: Dict, files: Iterable[Tuple[str, bytes]]) -> str:
+    # Skills are normalized exactly as score_candidate does (strip + lower, duplicates
+    # kept): inner whitespace matters to the scorer, so it must matter to the key
+    skills = job_req.get('skills', '')
+    if isinstance(skills, str):
+        skills = [s for s in skills.split(',') if s.strip()]
+    norm = {
+        'skills': sorted(s.strip().lower() for s in skills),
+        'experience': float(job_req.get('experience') or 0),
+        'education': _normalize_text(job_req.get('education', '')),
+        'weights': sorted((k, float(v)) for k, v in weights.items()),
+        # display names and upload order are part of the cached page (tied scores keep
+        # upload order, rank_candidates sorts stably), so they are part of the key
+        'files': [(digest.hex(), name) for name, digest in files],
+    }
+    return hashlib.sha256(json.dumps(norm, sort_keys=True).encode('utf-8')).hexdigest()
+
+class ResultCache:
+    def __init__(self, max_entries: int = 128, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Dict):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,10 +1,14 @@
 import re
+import time
 from typing import List, Dict, Optional
 from datetime import datetime
 import nltk
 from dateutil import parser as date_parser
 
 CURRENT_YEAR = datetime.today().year
+# Bump whenever extract_text / extract_resume_details output changes, so parses
+# cached in the shared candidate store are discarded instead of reused.
+PARSER_VERSION = 2
 
 # Download punkt tokenizer if not present
 try:
@@ -262,10 +266,25 @@ def extract_skills(text: str, skills_pool: Optional[List[str]] = None) -> List[s
             found.append(skill)
     return sorted(set(found))
 
-def extract_resume_details(text: str, skills_pool: Optional[List[str]] = None) -> Dict:
-    return {
-        'skills': extract_skills(text, skills_pool),
-        'experience': extract_experience(text),
-        'education': extract_education(text),
-        'raw_text': text
-    }
+def extract_resume_details(text: str, skills_pool: Optional[List[str]] = None,
+                           timings: Optional[Dict[str, float]] = None) -> Dict:
+    if timings is None:
+        return {
+            'skills': extract_skills(text, skills_pool),
+            'experience': extract_experience(text),
+            'education': extract_education(text),
+            'raw_text': text
+        }
+
+    # Profiling path: same result, with seconds spent in each extractor
+    details = {}
+    for key, name, extractor in (
+        ('skills', 'extract_skills', lambda: extract_skills(text, skills_pool)),
+        ('experience', 'extract_experience', lambda: extract_experience(text)),
+        ('education', 'extract_education', lambda: extract_education(text)),
+    ):
+        start = time.perf_counter()
+        details[key] = extractor()
+        timings[name] = time.perf_counter() - start
+    details['raw_text'] = text
+    return details
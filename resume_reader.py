@@ -1,6 +1,8 @@
 # resume_reader.py
 import os
+import zipfile
 from typing import Optional
+from xml.etree import ElementTree as ET
 try:
     import PyPDF2
 except Exception:
@@ -36,7 +38,97 @@ def extract_text_from_txt(txt_path: str) -> Optional[str]:
         print(f"Error reading TXT {txt_path}: {e}")
         return None
 
+# WordprocessingML tags used by the streaming DOCX reader
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = _W_NS + "body"
+_W_P = _W_NS + "p"
+_W_T = _W_NS + "t"
+_W_TAB = _W_NS + "tab"
+_W_BR = _W_NS + "br"
+_W_CR = _W_NS + "cr"
+_W_TBL = _W_NS + "tbl"
+_W_TR = _W_NS + "tr"
+_W_TC = _W_NS + "tc"
+# Text boxes are stored twice (mc:Choice + VML mc:Fallback); only the Choice is read
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+def _iter_docx_lines(fileobj):
+    # Yields one line per body paragraph and one tab-joined line per table row,
+    # in document order. Paragraphs nested in text boxes become their own lines,
+    # emitted after the paragraph that anchors them.
+    body = None
+    skip = 0        # depth inside mc:Fallback subtrees
+    # open containers: [tag, collected] where collected is the text parts of a
+    # paragraph, the lines of a cell, or the cells of a row
+    stack = []
+    for event, elem in ET.iterparse(fileobj, events=("start", "end")):
+        tag = elem.tag
+        if tag == _MC_FALLBACK:
+            skip += 1 if event == "start" else -1
+            continue
+        if skip:
+            continue
+        if event == "start":
+            if tag in (_W_P, _W_TC, _W_TR):
+                # paragraphs also carry the lines of nested text-box content
+                stack.append([tag, [], []] if tag == _W_P else [tag, []])
+            elif tag == _W_BODY:
+                body = elem
+            continue
+
+        if tag in (_W_T, _W_TAB, _W_BR, _W_CR):
+            if stack and stack[-1][0] == _W_P:
+                if tag == _W_T:
+                    if elem.text:
+                        stack[-1][1].append(elem.text)
+                else:
+                    stack[-1][1].append("\t" if tag == _W_TAB else "\n")
+            continue
+        elif tag == _W_P:
+            _, parts, nested = stack.pop()
+            lines = ["".join(parts)] + nested
+        elif tag == _W_TC:
+            cell = stack.pop()[1]
+            if stack:
+                stack[-1][1].append(" ".join(l.strip() for l in cell if l.strip()))
+            lines = None
+        elif tag == _W_TR:
+            row = stack.pop()[1]
+            text = "\t".join(c for c in row if c)
+            lines = [text] if text else []
+        elif tag != _W_TBL:
+            continue
+        else:
+            lines = None
+
+        if lines is not None:
+            if not stack:
+                if body is not None:
+                    yield from lines
+            elif stack[-1][0] == _W_P:
+                stack[-1][2].extend(lines)
+            else:
+                stack[-1][1].extend(lines)
+
+        # Drop finished top-level blocks so memory stays flat on large documents
+        if not stack:
+            elem.clear()
+            if body is not None:
+                body.clear()
+
 def extract_text_from_docx(docx_path: str) -> Optional[str]:
+    # Reads the zip directly instead of building the python-docx object model;
+    # also picks up text inside tables, which doc.paragraphs skips.
+    try:
+        with zipfile.ZipFile(docx_path) as zf:
+            with zf.open("word/document.xml") as f:
+                return "\n".join(_iter_docx_lines(f))
+    except Exception as e:
+        print(f"Error reading DOCX {docx_path}: {e}")
+        return None
+
+def extract_text_from_docx_python_docx(docx_path: str) -> Optional[str]:
+    # Previous python-docx based reader (paragraphs only); kept for comparison.
     if docx is None:
         print("python-docx not installed; can't read .docx files.")
         return None